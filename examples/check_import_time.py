@@ -0,0 +1,53 @@
+"""
+Check that importing `mpltools` stays cheap.
+
+Each import is timed in a fresh interpreter. The script fails if any import
+loads `matplotlib.pyplot` (which selects and loads a GUI backend) or if
+`import mpltools` parses config files.
+"""
+from __future__ import print_function
+
+import sys
+import subprocess
+
+
+# Modules that must not be loaded by each import statement.
+CHECKS = [
+    ('import mpltools', ['matplotlib', 'configobj', 'mpltools.color']),
+    ('import mpltools.color', ['matplotlib.pyplot']),
+    ('import mpltools.layout', ['matplotlib.pyplot']),
+    ('import mpltools.special', ['matplotlib.pyplot']),
+    ('import mpltools.annotation', ['matplotlib.pyplot']),
+    ('import mpltools.io', ['matplotlib.pyplot']),
+    ('from mpltools import style; style.lib', ['matplotlib.pyplot']),
+]
+
+SCRIPT = """
+import sys, time, warnings
+warnings.simplefilter('ignore')
+t0 = time.time()
+%s
+print(time.time() - t0)
+print(' '.join(name for name in %r if name in sys.modules))
+"""
+
+
+def check(statement, forbidden):
+    # `subprocess.check_output` isn't available on Python 2.6.
+    process = subprocess.Popen([sys.executable, '-c',
+                                SCRIPT % (statement, forbidden)],
+                               stdout=subprocess.PIPE)
+    output = process.communicate()[0]
+    if process.returncode != 0:
+        raise RuntimeError("Failed to run %r" % statement)
+    lines = output.decode().splitlines()
+    elapsed, loaded = float(lines[-2]), lines[-1].split()
+    print("%-45s %6.1f ms" % (statement, 1000 * elapsed))
+    for name in loaded:
+        print("    ERROR: loaded %r" % name)
+    return not loaded
+
+
+if __name__ == '__main__':
+    results = [check(statement, forbidden) for statement, forbidden in CHECKS]
+    sys.exit(0 if all(results) else 1)
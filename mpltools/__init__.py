@@ -13,6 +13,9 @@ layout
 special
     Specialty plotting functions (e.g. Hinton diagram).
 
+Subpackages are imported on first access (e.g. ``mpltools.color``), so that
+``import mpltools`` stays cheap.
+
 Attributes
 ==========
 config
@@ -20,8 +23,22 @@ config
 
 """
 from __future__ import absolute_import
-from . import _config
-config = _config.config
+import sys
+
+from ._lazy import lazy_attributes
 
 
 __version__ = '0.2.0'  # must be kept consistent with setup.py
+
+
+_SUBMODULES = ['animation', 'annotation', 'color', 'io', 'layout', 'special',
+               'style', 'util', 'widgets']
+
+if sys.version_info < (3, 7):
+    # Importing every subpackage would be expensive, so only `config` is
+    # imported eagerly on older Pythons.
+    from ._config import config  # noqa
+else:
+    _attributes = {'config': '._config'}
+    _attributes.update((name, '.' + name) for name in _SUBMODULES)
+    __getattr__ = lazy_attributes(__name__, _attributes)
@@ -0,0 +1,156 @@
+"""
+Caching utilities.
+"""
+import os
+import pickle
+import itertools
+import threading
+
+
+__all__ = ['LRUCache', 'read_cache_file', 'write_cache_file',
+           'load_or_build', 'load_pickle', 'dump_pickle']
+
+
+class LRUCache(object):
+    """Bounded mapping that discards the least-recently-used entries.
+
+    Lookups through `get` are counted in the `hits` and `misses` attributes.
+    The cache is safe to share between threads.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of entries. If None, the cache is unbounded.
+    """
+
+    def __init__(self, maxsize=128):
+        self._maxsize = maxsize
+        self._data = dict()
+        # Time of last use of each key, from a counter. (`OrderedDict` isn't
+        # available on Python 2.6.)
+        self._last_used = dict()
+        self._clock = itertools.count()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self):
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, value):
+        with self._lock:
+            self._maxsize = value
+            self._trim()
+
+    def get(self, key, default=None):
+        """Return cached value for `key`, or `default` if it's not cached."""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._last_used[key] = next(self._clock)
+            self.hits += 1
+            return value
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._last_used[key] = next(self._clock)
+            self._trim()
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __len__(self):
+        return len(self._data)
+
+    def clear(self):
+        """Remove all entries and reset hit/miss counters."""
+        with self._lock:
+            self._data.clear()
+            self._last_used.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        """Return dict of cache statistics."""
+        return dict(hits=self.hits, misses=self.misses,
+                    maxsize=self._maxsize, currsize=len(self._data))
+
+    def _trim(self):
+        if self._maxsize is None:
+            return
+        while len(self._data) > self._maxsize:
+            oldest = min(self._last_used, key=self._last_used.get)
+            del self._data[oldest]
+            del self._last_used[oldest]
+
+
+def read_cache_file(path, load):
+    """Return `load(path)`, or None if the cache file can't be loaded.
+
+    Missing, corrupt, and stale cache files are all treated as a cache miss;
+    `load` may return None to reject a stale file.
+    """
+    try:
+        return load(path)
+    except Exception:
+        return None
+
+
+def write_cache_file(path, write):
+    """Write cache file by calling `write(f)` with a temporary file object.
+
+    The temporary file is renamed to `path` when it's complete, so concurrent
+    readers never see a partially-written file. Caching is an optimization,
+    so errors are ignored (and the temporary file removed). Returns True if
+    the file was written.
+    """
+    tmp_path = '%s.%d.tmp' % (path, os.getpid())
+    try:
+        cache_dir = os.path.dirname(path)
+        if cache_dir and not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir)
+        with open(tmp_path, 'wb') as f:
+            write(f)
+        # `os.replace` also overwrites existing files on Windows.
+        getattr(os, 'replace', os.rename)(tmp_path, path)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return False
+    return True
+
+
+def load_or_build(path, load, build, write):
+    """Return value loaded from cache file, or built and saved there.
+
+    See `read_cache_file` and `write_cache_file`; `write` is called as
+    ``write(value, f)``. If `path` is None, the value is built without
+    caching.
+    """
+    if path is not None:
+        value = read_cache_file(path, load)
+        if value is not None:
+            return value
+    value = build()
+    if path is not None:
+        write_cache_file(path, lambda f: write(value, f))
+    return value
+
+
+def load_pickle(path):
+    """Return object unpickled from file `path`."""
+    with open(path, 'rb') as f:
+        return pickle.load(f)
+
+
+def dump_pickle(obj, f):
+    """Pickle object to file object `f`."""
+    pickle.dump(obj, f, pickle.HIGHEST_PROTOCOL)
@@ -2,10 +2,22 @@
 Configuration utilities.
 """
 import os
-from configobj import ConfigObj
+import ast
+import threading
+try:
+    from collections.abc import MutableMapping
+except ImportError:  # Python 2
+    from collections import MutableMapping
 
+from ._cache import load_or_build, load_pickle, dump_pickle
 
-__all__ = ['iter_paths', 'read', 'config']
+
+__all__ = ['iter_paths', 'read', 'config', 'LazyConfig']
+
+
+ENV_PREFIX = 'MPLTOOLS_'
+# Environment variable giving the path of the file caching the merged config.
+CACHE_ENV_VAR = 'MPLTOOLS_CONFIG_CACHE'
 
 
 def iter_paths(config_paths):
@@ -20,13 +32,135 @@ def iter_paths(config_paths):
 
 def read(path):
     """Return dict-like object of config parameters from file path."""
+    from configobj import ConfigObj
     return ConfigObj(path, unrepr=True)
 
 
+class LazyConfig(MutableMapping):
+    """Dict of config parameters that reads config files on first access.
+
+    Config files are read in order, with sections in later files replacing
+    those in earlier files. The merged result can be cached in a file, which
+    is used as long as the size and modification time of every config file is
+    unchanged.
+
+    Parameters in the top level of a section can be overridden with
+    environment variables named ``MPLTOOLS_<SECTION>_<KEY>`` (upper-case).
+    For example, ``MPLTOOLS_COLOR_CMAP="'Blues'"`` sets ``config['color']
+    ['cmap']``. Values are evaluated as Python literals, or used as strings
+    if that fails.
+
+    Parameters
+    ----------
+    paths : list of str
+        Paths to config files, from lowest to highest priority.
+    cache_path : str
+        Path of file caching the merged config. If None, nothing is cached.
+    environ : dict
+        Environment variables used to override parameters.
+    """
+
+    version = 1
+
+    def __init__(self, paths, cache_path=None, environ=os.environ):
+        self.paths = list(paths)
+        self.cache_path = cache_path
+        self.environ = environ
+        self._data = None
+        self._lock = threading.Lock()
+
+    @property
+    def data(self):
+        if self._data is None:
+            with self._lock:
+                if self._data is None:
+                    data = self._load()
+                    self._apply_environ(data)
+                    self._data = data
+        return self._data
+
+    def reload(self):
+        """Read config again on next access."""
+        self._data = None
+
+    def __getitem__(self, key):
+        return self.data[key]
+
+    def __setitem__(self, key, value):
+        self.data[key] = value
+
+    def __delitem__(self, key):
+        del self.data[key]
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __len__(self):
+        return len(self.data)
+
+    def __repr__(self):
+        return repr(self.data)
+
+    def _sources(self):
+        """Return list of (path, size, mtime) for existing config files."""
+        sources = []
+        for path in self.paths:
+            path = os.path.abspath(os.path.expanduser(path))
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            sources.append((path, stat.st_size, stat.st_mtime))
+        return sources
+
+    def _load(self):
+        sources = self._sources()
+
+        def load(path):
+            cached = load_pickle(path)
+            if (cached.get('version') == self.version and
+                    cached['sources'] == sources):
+                return cached['config']
+
+        def build():
+            data = dict()
+            for path, size, mtime in sources:
+                data.update(read(path).dict())
+            return data
+
+        def write(data, f):
+            cached = {'version': self.version, 'sources': sources,
+                      'config': data}
+            dump_pickle(cached, f)
+
+        cache_path = self.cache_path
+        if cache_path is not None:
+            cache_path = os.path.expanduser(cache_path)
+        return load_or_build(cache_path, load, build, write)
+
+    def _apply_environ(self, data):
+        for env_key, value in self.environ.items():
+            if not env_key.startswith(ENV_PREFIX) or env_key == CACHE_ENV_VAR:
+                continue
+            name = env_key[len(ENV_PREFIX):]
+            for section in data:
+                prefix = section.upper() + '_'
+                if name.startswith(prefix) and hasattr(data[section], 'keys'):
+                    key = name[len(prefix):].lower()
+                    data[section][key] = _parse_value(value)
+                    break
+
+
+def _parse_value(value):
+    try:
+        return ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        return value
+
+
 # Set mpltools specific properties (i.e., not matplotlib properties).
-config = {}
 pkgdir = os.path.abspath(os.path.dirname(__file__))
-for cfg in iter_paths([os.path.join(pkgdir, 'mpltoolsrc'),
-                       '~/.mpltoolsrc',
-                       './mpltoolsrc']):
-    config.update(cfg)
+config = LazyConfig([os.path.join(pkgdir, 'mpltoolsrc'),
+                     '~/.mpltoolsrc',
+                     './mpltoolsrc'],
+                    cache_path=os.environ.get(CACHE_ENV_VAR))
@@ -0,0 +1,48 @@
+"""
+Utilities for importing package attributes on first access.
+"""
+import sys
+
+
+__all__ = ['lazy_attributes']
+
+
+def lazy_attributes(package_name, attributes):
+    """Return module `__getattr__` that imports attributes on first access.
+
+    Python >= 3.7 calls a module's `__getattr__` for missing attributes, so
+    submodules are only imported when their attributes are first used. On
+    older versions, attributes are imported immediately.
+
+    Parameters
+    ----------
+    package_name : str
+        Name of the package (i.e. `__name__` of the calling `__init__`).
+    attributes : dict
+        Map of attribute names to the relative module (e.g. '.core') defining
+        them. If the module name matches the attribute name, the attribute is
+        the module itself.
+    """
+    def __getattr__(name):
+        try:
+            module_name = attributes[name]
+        except KeyError:
+            msg = "module %r has no attribute %r"
+            raise AttributeError(msg % (package_name, name))
+        # Modules are given relative to the package (e.g. '.core'). Use
+        # `__import__`, since `importlib` isn't available on Python 2.6.
+        full_name = package_name + module_name
+        __import__(full_name)
+        module = sys.modules[full_name]
+        if module_name.lstrip('.') == name:
+            value = module
+        else:
+            value = getattr(module, name)
+        # Cache the value so `__getattr__` is only called once per name.
+        setattr(sys.modules[package_name], name, value)
+        return value
+
+    if sys.version_info < (3, 7):
+        for name in attributes:
+            __getattr__(name)
+    return __getattr__
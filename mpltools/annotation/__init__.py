@@ -1,6 +1,8 @@
 from __future__ import absolute_import
 
-from ._slopemarker import slope_marker
+from .._lazy import lazy_attributes
 
 
 __all__ = ['slope_marker']
+
+__getattr__ = lazy_attributes(__name__, {'slope_marker': '._slopemarker'})
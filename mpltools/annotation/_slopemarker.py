@@ -1,7 +1,7 @@
 from __future__ import division
 from future.builtins import str
 import numpy as np
-import matplotlib.pyplot as plt
+from matplotlib.patches import Polygon
 
 
 __all__ = ['slope_marker']
@@ -33,6 +33,8 @@ def slope_marker(origin, slope, invert=False, size_frac=0.1, pad_frac=0.2,
     poly_kwargs : dict
         Keyword arguments passed to `matplotlib.patches.Polygon`.
     """
+    import matplotlib.pyplot as plt
+
     ax = ax if ax is not None else plt.gca()
     text_kwargs = {} if text_kwargs is None else text_kwargs
     poly_kwargs = {} if poly_kwargs is None else poly_kwargs
@@ -125,4 +127,4 @@ def _slope_triangle(origin, dx, dy, fc='0.8', **poly_kwargs):
     verts = [np.asarray(origin)]
     verts.append(verts[0] + (dx, 0))
     verts.append(verts[0] + (dx, dy))
-    return plt.Polygon(verts, **poly_kwargs)
+    return Polygon(verts, **poly_kwargs)
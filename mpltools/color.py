@@ -1,13 +1,21 @@
 from __future__ import division
-from future.builtins import zip
+from future.builtins import object, zip
+import os
+import zlib
+import hashlib
+
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.colors import LinearSegmentedColormap
+import matplotlib as mpl
+from matplotlib import cm
+from matplotlib.colors import LinearSegmentedColormap, colorConverter
 
+from ._cache import LRUCache, load_or_build
 from ._config import config
 
 
-__all__ = ['color_mapper', 'colors_from_cmap', 'cycle_cmap', 'LinearColormap']
+__all__ = ['color_mapper', 'colors_from_cmap', 'cycle_cmap', 'ColorMapper',
+           'BivariateColorMapper', 'CategoricalColorMapper', 'LinearColormap',
+           'auto_cmap_range', 'distinct_colors', 'perceptual_colormap']
 
 
 class LinearColormap(LinearSegmentedColormap):
@@ -60,6 +68,13 @@ class LinearColormap(LinearSegmentedColormap):
     >>> blue_clear_red = color.LinearColormap('blue_clear_red', bcr_rgba,
     ...                                       index=[0, 0.5, 0.5, 1])
 
+    Notes
+    -----
+    If the `lut_cache_dir` config setting is given, the colormap's lookup
+    table is saved to that directory when it's first built. Colormaps with
+    the same colors, index, `N`, and `gamma` then memory-map the saved lookup
+    table instead of rebuilding it.
+
     """
 
     def __init__(self, name, color_data, index=None, **kwargs):
@@ -69,15 +84,64 @@ class LinearColormap(LinearSegmentedColormap):
         if index is None:
             # If index not given, RGB colors are evenly-spaced in colormap.
             index = np.linspace(0, 1, len(color_data['red']))
+        index = np.asarray(index, dtype=float)
+
+        # Adapt color_data to the (x, y0, y1) rows expected by
+        # LinearSegmentedColormap.
+        segment_data = {}
+        for key, value in color_data.items():
+            value = np.asarray(value, dtype=float)
+            segment_data[key] = np.column_stack((index, value, value))
+        LinearSegmentedColormap.__init__(self, name, segment_data, **kwargs)
+
+    def _init(self):
+        cache_dir = config['color'].get('lut_cache_dir')
+        if cache_dir is None:
+            return LinearSegmentedColormap._init(self)
+
+        def build():
+            LinearSegmentedColormap._init(self)
+            return self._lut
 
-        # Adapt color_data to the form expected by LinearSegmentedColormap.
-        color_data = dict((key, [(x, y, y) for x, y in zip(index, value)])
-                          for key, value in color_data.items())
-        LinearSegmentedColormap.__init__(self, name, color_data, **kwargs)
+        key_data = [self.N, getattr(self, '_gamma', 1.0)]
+        for channel in sorted(self._segmentdata):
+            key_data += [channel, np.asarray(self._segmentdata[channel])]
+        # Copy-on-write mapping, since setting extreme colors modifies the
+        # lookup table.
+        self._lut = _cached_array(cache_dir, 'lut', key_data, build,
+                                  mmap_mode='c')
+        self._isinit = True
+        self._set_extremes()
+
+    @classmethod
+    def from_array(cls, name, colors, index=None, **kwargs):
+        """Create colormap from an array of RGB or RGBA colors.
+
+        This constructor is suited to colormaps with many control points
+        (e.g. colors derived from measured spectra).
+
+        Parameters
+        ----------
+        name : str
+            Name of colormap.
+        colors : (N, 3) or (N, 4) array
+            RGB or RGBA colors at each index value.
+        index : (N,) array of floats (0, 1)
+            If None, colors are equally spaced in colormap.
+        kwargs
+            Keyword arguments passed to `LinearSegmentedColormap` (e.g. `N`,
+            the number of colors in the colormap's lookup table).
+        """
+        colors = np.asarray(colors, dtype=float)
+        if colors.ndim != 2 or colors.shape[1] not in (3, 4):
+            raise ValueError("`colors` must have shape (N, 3) or (N, 4).")
+        if index is not None and len(index) != len(colors):
+            raise ValueError("`index` must match the length of `colors`.")
+        return cls(name, colors, index=index, **kwargs)
 
 
 def rgb_list_to_colordict(rgb_list):
-    colors_by_channel = list(zip(*rgb_list))
+    colors_by_channel = np.asarray(rgb_list, dtype=float).T
     channels = ('red', 'green', 'blue', 'alpha')
     return dict((color, value)
                 for color, value in zip(channels, colors_by_channel))
@@ -85,14 +149,301 @@ def rgb_list_to_colordict(rgb_list):
 
 CMAP_RANGE = config['color']['cmap_range']
 
+# Results of `colors_from_cmap`, keyed by the resolved colormap range. Set
+# `cmap_cache.maxsize` to resize the cache.
+cmap_cache = LRUCache(maxsize=config['color'].get('cache_size', 128))
+# Results of `auto_cmap_range`.
+range_cache = LRUCache(maxsize=config['color'].get('cache_size', 128))
+# Candidate colors and their distance matrices used by `distinct_colors`.
+distance_cache = LRUCache(maxsize=16)
+
+
+def _cmap_key(cmap):
+    """Return hashable cache key for colormap or colormap name.
+
+    Colormap objects are keyed by identity, so cache entries must keep a
+    reference to the colormap to prevent its id from being reused.
+    """
+    return cmap if isinstance(cmap, str) else id(cmap)
+
+
+def get_cmap_range(cmap=None, start=None, stop=None):
+    """Return colormap and the (start, stop) range used to sample it.
+
+    Parameters
+    ----------
+    cmap : str or colormap
+        A matplotlib colormap (see matplotlib.pyplot.cm) or the name of one.
+        Defaults to the colormap given in the package config.
+
+    start, stop: 0 <= float <= 1
+        Limit colormap to this range. If None, use the default start/stop
+        values of the colormap (see `CMAP_RANGE`). Colormaps missing from
+        `CMAP_RANGE` use the full range, or the range computed by
+        `auto_cmap_range` if the `auto_range` config setting is True.
+
+    Returns
+    -------
+    cmap : colormap
+    start, stop : float
+    """
+    if cmap is None:
+        cmap = config['color']['cmap']
+    if isinstance(cmap, str):
+        cmap = getattr(cm, cmap)
+
+    if cmap.name in CMAP_RANGE:
+        crange = list(CMAP_RANGE[cmap.name])
+    elif config['color'].get('auto_range', False):
+        crange = list(auto_cmap_range(cmap))
+    else:
+        crange = [0, 1]
+    if start is not None:
+        crange[0] = start
+    if stop is not None:
+        crange[1] = stop
+
+    assert 0 <= crange[0] <= 1
+    assert 0 <= crange[1] <= 1
+    return cmap, crange[0], crange[1]
+
+
+def relative_luminance(rgb):
+    """Return relative luminance (0--1) of sRGB(A) colors."""
+    rgb = np.asarray(rgb, dtype=float)[..., :3]
+    linear = np.where(rgb <= 0.04045, rgb / 12.92,
+                      ((rgb + 0.055) / 1.055) ** 2.4)
+    return np.dot(linear, _RGB_TO_XYZ[1])
+
+
+def auto_cmap_range(cmap, background=None, min_contrast=None):
+    """Return (start, stop) range of colormap that is visible on background.
+
+    Colors at either end of the colormap whose luminance contrast with the
+    background is below `min_contrast` are trimmed. The orientation of the
+    colormap is preserved, so start < stop. Results are cached in
+    `range_cache`.
+
+    Parameters
+    ----------
+    cmap : str or colormap
+        A matplotlib colormap (see matplotlib.pyplot.cm) or the name of one.
+
+    background : color
+        Background color. Defaults to the axes background color
+        (rcParams['axes.facecolor']).
+
+    min_contrast : float
+        Minimum contrast ratio, (L1 + 0.05) / (L2 + 0.05), between a color
+        and the background, where L1 and L2 are the relative luminances of the
+        lighter and darker colors. Defaults to the `min_contrast` config
+        setting.
+    """
+    if isinstance(cmap, str):
+        cmap = getattr(cm, cmap)
+    if background is None:
+        background = mpl.rcParams['axes.facecolor']
+    if min_contrast is None:
+        min_contrast = config['color'].get('min_contrast', 1.3)
+    background = tuple(colorConverter.to_rgb(background))
+
+    key = (_cmap_key(cmap), background, min_contrast)
+    entry = range_cache.get(key)
+    if entry is not None:
+        return entry[1]
+
+    x = np.linspace(0, 1, cmap.N)
+    luminance = relative_luminance(cmap(x))
+    bg_luminance = relative_luminance(background)
+    contrast = ((np.maximum(luminance, bg_luminance) + 0.05) /
+                (np.minimum(luminance, bg_luminance) + 0.05))
+
+    visible = np.flatnonzero(contrast >= min_contrast)
+    if len(visible) == 0:
+        crange = (0, 1)
+    else:
+        crange = (float(x[visible[0]]), float(x[visible[-1]]))
+    range_cache[key] = (cmap, crange)
+    return crange
+
+
+class _Immutable(object):
+    """Base class of immutable objects with `__slots__` that can be pickled.
+
+    Attributes are set with `__setstate__`, which also makes array attributes
+    read-only.
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        msg = "%s objects are immutable." % type(self).__name__
+        raise AttributeError(msg)
+
+    def __getstate__(self):
+        return dict((name, getattr(self, name))
+                    for cls in type(self).__mro__
+                    for name in getattr(cls, '__slots__', ()))
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            if isinstance(value, np.ndarray):
+                value.flags.writeable = False
+            object.__setattr__(self, name, value)
+
+
+def _check_range(vmin, vmax):
+    if not vmin < vmax:
+        msg = "Parameter range (%s, %s) must be increasing and non-empty."
+        raise ValueError(msg % (vmin, vmax))
+
+
+class _LinearNorm(_Immutable):
+    """Map values in (vmin, vmax) linearly onto (0, 1)."""
+
+    __slots__ = ('vmin', 'vmax')
+
+    def __init__(self, parameter_range):
+        vmin, vmax = parameter_range
+        _check_range(vmin, vmax)
+        self.__setstate__(dict(vmin=vmin, vmax=vmax))
+
+    def transform(self, val):
+        return val
+
+    def __call__(self, val):
+        tmin, tmax = self.transform(np.array([self.vmin, self.vmax]))
+        return (self.transform(val) - tmin) * (1.0 / (tmax - tmin))
 
-def color_mapper(parameter_range, cmap=None, start=None, stop=None):
+
+class _LogNorm(_LinearNorm):
+    """Map values in (vmin, vmax) onto (0, 1) on a logarithmic scale."""
+
+    def __init__(self, parameter_range):
+        _LinearNorm.__init__(self, parameter_range)
+        if self.vmin <= 0:
+            raise ValueError("Log normalization requires a positive range.")
+
+    def transform(self, val):
+        return np.log(val)
+
+
+class _SymLogNorm(_LinearNorm):
+    """Map values onto (0, 1) on a log scale that is linear near zero.
+
+    Parameters
+    ----------
+    linthresh : float
+        Scale of the region around zero where the mapping is nearly linear.
+    """
+
+    __slots__ = ('linthresh',)
+
+    def __init__(self, parameter_range, linthresh=1):
+        _LinearNorm.__init__(self, parameter_range)
+        self.__setstate__(dict(linthresh=float(linthresh)))
+
+    def transform(self, val):
+        return np.sign(val) * np.log1p(np.abs(val) / self.linthresh)
+
+
+class _PowerNorm(_LinearNorm):
+    """Map values in (vmin, vmax) onto (0, 1) following a power law.
+
+    Parameters
+    ----------
+    gamma : float
+        Exponent applied to linearly-normalized values.
+    """
+
+    __slots__ = ('gamma',)
+
+    def __init__(self, parameter_range, gamma=1):
+        _LinearNorm.__init__(self, parameter_range)
+        self.__setstate__(dict(gamma=gamma))
+
+    def __call__(self, val):
+        val_norm = _LinearNorm.__call__(self, val)
+        return np.maximum(val_norm, 0) ** self.gamma
+
+
+class _QuantileNorm(_Immutable):
+    """Map values onto (0, 1) by their quantile in a sample of values.
+
+    Parameters
+    ----------
+    sample : array
+        Sample of parameter values used to compute quantile breakpoints.
+    n_quantiles : int
+        Number of quantile intervals; values are interpolated linearly
+        between breakpoints.
+    """
+
+    __slots__ = ('breakpoints', 'vmin', 'vmax')
+
+    def __init__(self, sample, n_quantiles=100):
+        q = np.linspace(0, 100, n_quantiles + 1)
+        breakpoints = np.percentile(np.ravel(sample), q)
+        vmin, vmax = breakpoints[0], breakpoints[-1]
+        _check_range(vmin, vmax)
+        self.__setstate__(dict(breakpoints=breakpoints, vmin=vmin, vmax=vmax))
+
+    def __call__(self, val):
+        bp = self.breakpoints
+        n_bins = len(bp) - 1
+        i_bin = np.searchsorted(bp, val, side='right') - 1
+        i_bin = np.clip(i_bin, 0, n_bins - 1)
+        lower = bp[i_bin]
+        width = bp[i_bin + 1] - lower
+        # Repeated breakpoints give empty bins; map those to the bin's start.
+        width = np.where(width == 0, np.inf, width)
+        return (i_bin + (val - lower) / width) / n_bins
+
+
+NORMALIZATIONS = {'linear': _LinearNorm,
+                  'log': _LogNorm,
+                  'symlog': _SymLogNorm,
+                  'power': _PowerNorm,
+                  'quantile': _QuantileNorm}
+
+
+def get_norm(parameter_range, norm='linear', **norm_kwargs):
+    """Return function normalizing parameter values onto (0, 1).
+
+    Parameters
+    ----------
+    parameter_range : tuple of floats or array
+        Minimum and maximum value of parameter. For 'quantile' normalization,
+        a sample of parameter values.
+    norm : {'linear' | 'log' | 'symlog' | 'power' | 'quantile'}
+        Normalization of parameter values.
+    norm_kwargs
+        Keyword arguments for the normalization: `linthresh` for 'symlog',
+        `gamma` for 'power', and `n_quantiles` for 'quantile'.
+
+    Returns
+    -------
+    normalize : callable
+        Function mapping parameter values to (0, 1). The normalized range of
+        parameter values is given by its `vmin` and `vmax` attributes.
+    """
+    try:
+        norm_class = NORMALIZATIONS[norm]
+    except KeyError:
+        msg = "Unknown normalization %r; choose from %s."
+        raise ValueError(msg % (norm, sorted(NORMALIZATIONS)))
+    return norm_class(parameter_range, **norm_kwargs)
+
+
+def color_mapper(parameter_range, cmap=None, start=None, stop=None,
+                 norm='linear', **norm_kwargs):
     """Return color mapper, which returns color based on parameter value.
 
     Parameters
     ----------
     parameter_range : tuple of floats
-        Minimum and maximum value of parameter.
+        Minimum and maximum value of parameter. For 'quantile' normalization,
+        a sample of parameter values.
 
     cmap : str or colormap
         A matplotlib colormap (see matplotlib.pyplot.cm) or the name of one.
@@ -101,38 +452,347 @@ def color_mapper(parameter_range, cmap=None, start=None, stop=None):
         Limit colormap to this range (start < stop 1). You should limit the
         range of colormaps with light values (assuming a white background).
 
+    norm : {'linear' | 'log' | 'symlog' | 'power' | 'quantile'}
+        Normalization of parameter values. 'quantile' maps values by their
+        quantile in the sample given as `parameter_range`.
+
+    norm_kwargs
+        Keyword arguments for the normalization (see `get_norm`).
+
     Returns
     -------
     map_color : function
-        Function that returns an RGBA color from a parameter value.
+        Function that returns an RGBA color from a parameter value. Arrays of
+        parameter values (of any shape) are mapped in a single vectorized
+        call, which returns an array of RGBA colors with shape ``(..., 4)``.
 
-    """
-    if cmap is None:
-        cmap = config['color']['cmap']
-    if isinstance(cmap, str):
-        cmap = getattr(plt.cm, cmap)
-
-    crange = list(CMAP_RANGE.get(cmap.name, (0, 1)))
-    if start is None:
-        start = crange[0]
-    if stop is None:
-        stop = crange[1]
+    See Also
+    --------
+    ColorMapper : Lookup-table based mapper, which can also be pickled.
 
-    assert 0 <= start <= 1
-    assert 0 <= stop <= 1
+    """
+    cmap, start, stop = get_cmap_range(cmap, start, stop)
 
-    pmin, pmax = parameter_range
+    normalize = get_norm(parameter_range, norm, **norm_kwargs)
+    pmin, pmax = normalize.vmin, normalize.vmax
 
     def map_color(val):
-        """Return color based on parameter value `val`."""
-        assert pmin <= val <= pmax
-        val_norm = (val - pmin) * float(stop - start) / (pmax - pmin)
-        idx = val_norm + start
+        """Return color based on parameter value(s) `val`."""
+        val = np.asarray(val, dtype=float)
+        assert np.all((pmin <= val) & (val <= pmax))
+        idx = normalize(val) * (stop - start) + start
+        if idx.ndim == 0:
+            # Return an RGBA tuple for scalar input, as the colormap does.
+            idx = float(idx)
         return cmap(idx)
 
     return map_color
 
 
+class ColorMapper(_Immutable):
+    """Map parameter values to colors using a precomputed lookup table.
+
+    The colormap, limited to the (start, stop) range, is sampled once into a
+    lookup table when the mapper is created. Parameter values are then mapped
+    to colors by indexing into that table, which avoids interpolating the
+    colormap on every call.
+
+    Parameters
+    ----------
+    parameter_range : tuple of floats
+        Minimum and maximum value of parameter. For 'quantile' normalization,
+        a sample of parameter values.
+
+    cmap : str or colormap
+        A matplotlib colormap (see matplotlib.pyplot.cm) or the name of one.
+
+    start, stop: 0 <= float <= 1
+        Limit colormap to this range (start < stop 1). You should limit the
+        range of colormaps with light values (assuming a white background).
+
+    norm : {'linear' | 'log' | 'symlog' | 'power' | 'quantile'}
+        Normalization of parameter values (see `color_mapper`).
+
+    lut_size : int
+        Number of colors in the lookup table. Defaults to the number of colors
+        in `cmap`.
+
+    bytes : bool
+        If True, return RGBA colors as uint8 values (0--255) instead of floats
+        (0--1). This uses an eighth of the memory of the float output.
+
+    clip : bool
+        If True, values outside `parameter_range` are clipped to the range.
+        Otherwise, a ValueError is raised for out-of-range values. NaN values
+        always raise a ValueError.
+
+    norm_kwargs
+        Keyword arguments for the normalization (see `get_norm`).
+
+    Notes
+    -----
+    Mappers, including their normalization and lookup table, are immutable
+    and can be pickled (e.g. to send them to worker processes) or shared
+    between threads without locking.
+
+    Examples
+    --------
+    >>> map_color = ColorMapper((0, 10), cmap='Blues', bytes=True)
+    >>> rgba = map_color(np.random.uniform(0, 10, size=(480, 640)))
+    >>> rgba.shape, rgba.dtype
+    ((480, 640, 4), dtype('uint8'))
+
+    See Also
+    --------
+    color_mapper
+
+    """
+
+    __slots__ = ('normalize', 'clip', 'lut')
+
+    def __init__(self, parameter_range, cmap=None, start=None, stop=None,
+                 norm='linear', lut_size=None, bytes=False, clip=False,
+                 **norm_kwargs):
+        cmap, start, stop = get_cmap_range(cmap, start, stop)
+        if lut_size is None:
+            lut_size = cmap.N
+
+        normalize = get_norm(parameter_range, norm, **norm_kwargs)
+        lut = cmap(np.linspace(start, stop, lut_size), bytes=bytes)
+        self.__setstate__(dict(normalize=normalize, clip=clip, lut=lut))
+
+    def __call__(self, val, out=None, chunksize=None):
+        """Return RGBA colors for parameter value(s) `val`.
+
+        Parameters
+        ----------
+        val : float or array
+            Parameter value(s). Large inputs, such as `np.memmap` arrays, can
+            be mapped in blocks by setting `chunksize`.
+        out : array
+            C-contiguous array of shape ``val.shape + (4,)`` and the same dtype
+            as the lookup table, where the colors are written. If None, a new
+            array is allocated.
+        chunksize : int
+            If given, map `val` in blocks of rows (along its first axis) with
+            about this many elements, so that temporary arrays stay bounded
+            by the block size. A block has at least one row.
+
+        Returns
+        -------
+        rgba : array
+            RGBA colors with shape ``val.shape + (4,)``. This is `out`, if
+            given.
+        """
+        if out is None and chunksize is None:
+            return self.lut[self.lut_index(val)]
+
+        val = np.asanyarray(val)
+        shape = val.shape + (4,)
+        if out is None:
+            out = np.empty(shape, dtype=self.lut.dtype)
+        elif out.shape != shape:
+            raise ValueError("`out` must have shape %s" % (shape,))
+        elif out.dtype != self.lut.dtype:
+            raise ValueError("`out` must have dtype %s" % self.lut.dtype)
+        elif not out.flags.c_contiguous:
+            raise ValueError("`out` must be C-contiguous")
+
+        if val.ndim == 0 or chunksize is None:
+            blocks = [Ellipsis]
+        else:
+            # Iterate over blocks of the first axis, since flattening a
+            # non-contiguous `val` (e.g. a strided memmap) would copy it.
+            row_size = max(val[0:1].size, 1)
+            step = max(chunksize // row_size, 1)
+            blocks = [slice(i, i + step) for i in range(0, len(val), step)]
+        for block in blocks:
+            idx = self.lut_index(val[block])
+            # Indices are validated by `lut_index`, so clipping never changes
+            # them, but unlike the default mode, it lets `take` write directly
+            # to `out` instead of buffering.
+            np.take(self.lut, idx, axis=0, out=out[block], mode='clip')
+        return out
+
+    def lut_index(self, val):
+        """Return lookup-table indices for parameter value(s) `val`."""
+        return _lut_index(val, self.normalize, len(self.lut), self.clip)
+
+
+def _lut_index(val, normalize, lut_size, clip):
+    """Return indices into lookup table of `lut_size` for values `val`."""
+    val = np.asarray(val, dtype=float)
+    pmin, pmax = normalize.vmin, normalize.vmax
+    if val.size:
+        # NaN propagates through min and max, but fails every comparison.
+        vmin, vmax = val.min(), val.max()
+        if np.isnan(vmin) or np.isnan(vmax):
+            raise ValueError("Values must not be NaN.")
+        if clip:
+            val = np.clip(val, pmin, pmax)
+        elif vmin < pmin or vmax > pmax:
+            msg = "Values must lie within the parameter range (%s, %s)."
+            raise ValueError(msg % (pmin, pmax))
+
+    idx = normalize(val) * (lut_size - 1)
+    # Round to the nearest table entry.
+    idx += 0.5
+    return idx.astype(np.intp)
+
+
+class BivariateColorMapper(_Immutable):
+    """Map pairs of parameter values to colors using a 2D lookup table.
+
+    The lookup table is either a blend of two colormaps---one for each
+    parameter---or a bilinear interpolation between four corner colors.
+
+    Parameters
+    ----------
+    parameter_ranges : pair of tuples of floats
+        Minimum and maximum value of each parameter.
+
+    cmaps : pair of str or colormap
+        Colormaps for the first and second parameter. The color for a pair of
+        values is the average of the colors from each colormap. Each colormap
+        is limited to its default (start, stop) range (see `CMAP_RANGE`).
+
+    corners : list of 4 RGB or RGBA colors
+        Colors at (min1, min2), (max1, min2), (min1, max2), and (max1, max2).
+        Use instead of `cmaps`.
+
+    lut_shape : pair of ints
+        Number of colors along each parameter axis of the lookup table.
+
+    norms : pair of str
+        Normalization of each parameter (see `color_mapper`). Only
+        normalizations without keyword arguments are supported.
+
+    bytes : bool
+        If True, return RGBA colors as uint8 values (0--255) instead of floats
+        (0--1).
+
+    clip : bool
+        If True, values outside parameter ranges are clipped to the ranges.
+        Otherwise, a ValueError is raised for out-of-range values.
+
+    Examples
+    --------
+    Color by value (blue to red) and fade to gray with uncertainty:
+
+    >>> corners = [(0, 0, 1), (1, 0, 0), (0.7, 0.7, 0.7), (0.7, 0.7, 0.7)]
+    >>> map_color = BivariateColorMapper([(-1, 1), (0, 0.5)], corners=corners)
+    >>> rgba = map_color(value, uncertainty)
+
+    """
+
+    __slots__ = ('normalize', 'clip', 'lut')
+
+    def __init__(self, parameter_ranges, cmaps=None, corners=None,
+                 lut_shape=(64, 64), norms=('linear', 'linear'), bytes=False,
+                 clip=False):
+        n1, n2 = lut_shape
+        if corners is not None:
+            corners = np.asarray([colorConverter.to_rgba(c) for c in corners])
+            x = np.linspace(0, 1, n1)[:, np.newaxis, np.newaxis]
+            y = np.linspace(0, 1, n2)[np.newaxis, :, np.newaxis]
+            c00, c10, c01, c11 = corners
+            lut = ((1 - x) * (1 - y) * c00 + x * (1 - y) * c10 +
+                   (1 - x) * y * c01 + x * y * c11)
+        else:
+            if cmaps is None:
+                raise ValueError("Either `cmaps` or `corners` is required.")
+            cmap1, start1, stop1 = get_cmap_range(cmaps[0])
+            cmap2, start2, stop2 = get_cmap_range(cmaps[1])
+            colors1 = cmap1(np.linspace(start1, stop1, n1))
+            colors2 = cmap2(np.linspace(start2, stop2, n2))
+            lut = (colors1[:, np.newaxis] + colors2[np.newaxis, :]) / 2.
+        if bytes:
+            lut = (lut * 255 + 0.5).astype(np.uint8)
+
+        normalize = tuple(get_norm(prange, norm)
+                          for prange, norm in zip(parameter_ranges, norms))
+        self.__setstate__(dict(normalize=normalize, clip=clip, lut=lut))
+
+    def __call__(self, val1, val2):
+        """Return RGBA colors for pairs of parameter values.
+
+        `val1` and `val2` are broadcast against each other, and the returned
+        array has shape ``broadcast_shape + (4,)``.
+        """
+        n1, n2 = self.lut.shape[:2]
+        idx1 = _lut_index(val1, self.normalize[0], n1, self.clip)
+        idx2 = _lut_index(val2, self.normalize[1], n2, self.clip)
+        return self.lut[idx1, idx2]
+
+
+class CategoricalColorMapper(object):
+    """Map category labels to colors from a palette.
+
+    Each label is assigned a palette color by hashing its string
+    representation (with integral floats written as integers), so the same
+    label gets the same color in every process, regardless of which other
+    labels are mapped. Distinct labels may share a color when there are more
+    labels than palette colors.
+
+    Parameters
+    ----------
+    palette : list of colors
+        Colors assigned to categories. If None, `n_colors` colors are taken
+        from `cmap` (see `colors_from_cmap`).
+
+    cmap : str or colormap
+        A matplotlib colormap (see matplotlib.pyplot.cm) or the name of one.
+
+    n_colors : int
+        The number of colors taken from `cmap` when `palette` is None.
+
+    bytes : bool
+        If True, return RGBA colors as uint8 values (0--255) instead of floats
+        (0--1).
+
+    Examples
+    --------
+    >>> map_color = CategoricalColorMapper(cmap='jet')
+    >>> rgba = map_color(['a', 'b', 'a', 'c'])
+
+    """
+
+    def __init__(self, palette=None, cmap=None, n_colors=50, bytes=False):
+        if palette is None:
+            palette = colors_from_cmap(n_colors, cmap)
+        palette = np.array([colorConverter.to_rgba(c) for c in palette])
+        if bytes:
+            palette = (palette * 255 + 0.5).astype(np.uint8)
+        palette.flags.writeable = False
+        self.palette = palette
+
+    def __call__(self, labels):
+        """Return RGBA colors for category label(s).
+
+        The returned array has shape ``labels.shape + (4,)``.
+        """
+        return self.palette[self.palette_index(labels)]
+
+    def palette_index(self, labels):
+        """Return palette indices for category label(s)."""
+        labels = np.asarray(labels)
+        unique_labels, inverse = np.unique(labels, return_inverse=True)
+        n_colors = len(self.palette)
+        unique_idx = np.array([_label_hash(label) % n_colors
+                               for label in unique_labels.tolist()],
+                              dtype=np.intp)
+        return unique_idx[inverse].reshape(labels.shape)
+
+
+def _label_hash(label):
+    """Return hash of category label that is the same in every process."""
+    if isinstance(label, float) and label.is_integer():
+        # Integer labels stored in a float array (e.g. to allow NaN) should
+        # get the same color as in an integer array.
+        label = int(label)
+    return zlib.crc32(str(label).encode('utf-8')) & 0xffffffff
+
+
 def colors_from_cmap(length=50, cmap=None, start=None, stop=None):
     """Return color cycle from a given colormap.
 
@@ -153,8 +813,9 @@ def colors_from_cmap(length=50, cmap=None, start=None, stop=None):
 
     Returns
     -------
-    colors : list
-        List of RGBA colors.
+    colors : array
+        Read-only array of RGBA colors. Results are cached in `cmap_cache`,
+        so repeated calls with the same arguments return the same array.
 
     See Also
     --------
@@ -163,20 +824,19 @@ def colors_from_cmap(length=50, cmap=None, start=None, stop=None):
     """
     if cmap is None:
         cmap = config['color']['cmap']
-    if isinstance(cmap, str):
-        cmap = getattr(plt.cm, cmap)
-
-    crange = list(CMAP_RANGE.get(cmap.name, (0, 1)))
-    if start is not None:
-        crange[0] = start
-    if stop is not None:
-        crange[1] = stop
+    # Resolve the range first, since it may depend on `CMAP_RANGE`, config
+    # settings, and the axes background (see `auto_cmap_range`).
+    cmap_obj, start, stop = get_cmap_range(cmap, start, stop)
+    key = (_cmap_key(cmap), length, start, stop)
 
-    assert 0 <= crange[0] <= 1
-    assert 0 <= crange[1] <= 1
+    entry = cmap_cache.get(key)
+    if entry is not None:
+        return entry[1]
 
-    idx = np.linspace(crange[0], crange[1], num=length)
-    return cmap(idx)
+    colors = cmap_obj(np.linspace(start, stop, num=length))
+    colors.flags.writeable = False
+    cmap_cache[key] = (cmap, colors)
+    return colors
 
 
 def cycle_cmap(length=50, cmap=None, start=None, stop=None, ax=None):
@@ -212,6 +872,224 @@ def cycle_cmap(length=50, cmap=None, start=None, stop=None, ax=None):
     color_cycle = colors_from_cmap(length, cmap, start, stop)
 
     if ax is None:
-        plt.rc('axes', color_cycle=color_cycle.tolist())
+        mpl.rc('axes', color_cycle=color_cycle.tolist())
     else:
         ax.set_color_cycle(color_cycle)
+
+
+# sRGB (D65) to CIE XYZ conversion matrix and reference white.
+_RGB_TO_XYZ = np.array([[0.4124564, 0.3575761, 0.1804375],
+                        [0.2126729, 0.7151522, 0.0721750],
+                        [0.0193339, 0.1191920, 0.9503041]])
+_WHITE_D65 = _RGB_TO_XYZ.sum(axis=1)
+_LAB_EPSILON = (6 / 29.) ** 3
+
+
+def rgb_to_lab(rgb):
+    """Return CIELAB coordinates of sRGB(A) colors.
+
+    Parameters
+    ----------
+    rgb : (..., 3) or (..., 4) array
+        sRGB colors with values in (0, 1). Alpha values are ignored.
+
+    Returns
+    -------
+    lab : (..., 3) array
+        Lightness (0--100) and a*, b* coordinates.
+    """
+    rgb = np.asarray(rgb, dtype=float)[..., :3]
+    linear = np.where(rgb <= 0.04045, rgb / 12.92,
+                      ((rgb + 0.055) / 1.055) ** 2.4)
+    xyz = np.dot(linear, _RGB_TO_XYZ.T) / _WHITE_D65
+    f = np.where(xyz > _LAB_EPSILON, np.cbrt(xyz),
+                 xyz / (3 * (6 / 29.) ** 2) + 4 / 29.)
+    fx, fy, fz = np.rollaxis(f, -1)
+    return np.stack((116 * fy - 16, 500 * (fx - fy), 200 * (fy - fz)), axis=-1)
+
+
+def lab_to_rgb(lab):
+    """Return sRGB colors of CIELAB coordinates.
+
+    Colors outside the sRGB gamut are clipped to (0, 1).
+
+    Parameters
+    ----------
+    lab : (..., 3) array
+        Lightness (0--100) and a*, b* coordinates.
+
+    Returns
+    -------
+    rgb : (..., 3) array
+    """
+    L, a, b = np.rollaxis(np.asarray(lab, dtype=float), -1)
+    fy = (L + 16) / 116.
+    f = np.stack((fy + a / 500., fy, fy - b / 200.), axis=-1)
+    xyz = np.where(f > 6 / 29., f ** 3, 3 * (6 / 29.) ** 2 * (f - 4 / 29.))
+    linear = np.dot(xyz * _WHITE_D65, np.linalg.inv(_RGB_TO_XYZ).T)
+    linear = np.clip(linear, 0, 1)
+    return np.where(linear <= 0.0031308, 12.92 * linear,
+                    1.055 * linear ** (1 / 2.4) - 0.055)
+
+
+def _cached_array(cache_dir, prefix, key_data, build, mmap_mode=None):
+    """Return array loaded from `cache_dir`, or built and saved there.
+
+    The file name is derived from `prefix` and a hash of `key_data` (a list of
+    arrays and other values with a stable `repr`). If `cache_dir` is None,
+    the array is built without caching. Cached arrays are loaded with the
+    given `mmap_mode` (see `np.load`), and unreadable files are rebuilt.
+    """
+    if cache_dir is None:
+        return build()
+
+    digest = hashlib.sha1()
+    for data in key_data:
+        if isinstance(data, np.ndarray):
+            digest.update(np.ascontiguousarray(data).tobytes())
+            data = data.shape
+        digest.update(repr(data).encode())
+    cache_dir = os.path.expanduser(cache_dir)
+    path = os.path.join(cache_dir, '%s-%s.npy' % (prefix, digest.hexdigest()))
+
+    def load(path):
+        # Return a plain array view of memory-mapped data.
+        return np.load(path, mmap_mode=mmap_mode).view(np.ndarray)
+
+    return load_or_build(path, load, build,
+                         lambda array, f: np.save(f, array))
+
+
+def perceptual_colormap(name, colors, index=None, N=256,
+                        monotonic_lightness=False, cache_dir=None):
+    """Return colormap interpolating between colors in CIELAB color space.
+
+    Unlike `LinearColormap`, which interpolates linearly in RGB, colors are
+    interpolated in the (approximately) perceptually-uniform CIELAB space.
+
+    Parameters
+    ----------
+    name : str
+        Name of colormap.
+    colors : list of RGB or RGBA tuples or (M, 3|4) array
+        Colors at each index value. Alpha values are interpolated linearly.
+    index : list of floats (0, 1)
+        Note that these indices must match the length of `colors`. If None,
+        colors are equally spaced in colormap.
+    N : int
+        Number of colors in the colormap.
+    monotonic_lightness : bool
+        If True, force lightness to increase (or decrease) monotonically from
+        the start to the end of the colormap. Note that colors outside the
+        sRGB gamut are clipped, which can perturb lightness slightly.
+    cache_dir : str
+        Computed colors are saved in this directory and loaded on later calls
+        with the same arguments. Defaults to the `lut_cache_dir` config
+        setting; colors are not cached if both are None.
+
+    Examples
+    --------
+    >>> cmap = perceptual_colormap('blue_yellow', [(0.1, 0.1, 0.5),
+    ...                                            (1.0, 0.9, 0.3)])
+
+    """
+    colors = np.asarray(colors, dtype=float)
+    if index is None:
+        index = np.linspace(0, 1, len(colors))
+    index = np.asarray(index, dtype=float)
+
+    def build():
+        x = np.linspace(0, 1, N)
+        lab = rgb_to_lab(colors)
+        lab = np.column_stack([np.interp(x, index, channel)
+                               for channel in lab.T])
+        if monotonic_lightness:
+            lightness = lab[:, 0]
+            if lightness[-1] >= lightness[0]:
+                np.maximum.accumulate(lightness, out=lightness)
+            else:
+                np.minimum.accumulate(lightness, out=lightness)
+        rgb = lab_to_rgb(lab)
+        if colors.shape[1] == 4:
+            alpha = np.interp(x, index, colors[:, 3])
+            rgb = np.column_stack((rgb, alpha))
+        return rgb
+
+    if cache_dir is None:
+        cache_dir = config['color'].get('lut_cache_dir')
+    key_data = [colors, index, N, monotonic_lightness]
+    color_array = _cached_array(cache_dir, 'lab', key_data, build)
+    return LinearColormap.from_array(name, color_array, N=N)
+
+
+def distinct_colors(length, cmap=None, start=None, stop=None,
+                    n_candidates=256):
+    """Return colors from colormap(s) that are maximally distinct.
+
+    Colors are chosen from `n_candidates` evenly-spaced samples of each
+    colormap by farthest-point sampling in CIELAB color space: each new color
+    is the candidate farthest from all previously-chosen colors. Unlike
+    `colors_from_cmap`, this keeps colors distinguishable for large `length`.
+
+    Parameters
+    ----------
+    length : int
+        The number of colors.
+
+    cmap : str, colormap, or list of these
+        A matplotlib colormap (see matplotlib.pyplot.cm) or the name of one.
+        If given a list, colors are chosen from the union of the colormaps.
+
+    start, stop: 0 <= float <= 1
+        Limit colormap(s) to this range (see `colors_from_cmap`).
+
+    n_candidates : int
+        Number of colors sampled from each colormap.
+
+    Returns
+    -------
+    colors : (length, 4) array
+        RGBA colors, ordered from most to least distinct.
+
+    See Also
+    --------
+    colors_from_cmap
+
+    """
+    if cmap is None or isinstance(cmap, str) or not np.iterable(cmap):
+        cmap = [cmap]
+    cmap = [config['color']['cmap'] if c is None else c for c in cmap]
+
+    # Key on the resolved ranges, which may depend on `CMAP_RANGE`, config
+    # settings, and the axes background (see `get_cmap_range`).
+    ranges = tuple(get_cmap_range(c, start, stop)[1:] for c in cmap)
+    key = (tuple(_cmap_key(c) for c in cmap), ranges, n_candidates)
+    entry = distance_cache.get(key)
+    if entry is None:
+        candidates = np.concatenate([colors_from_cmap(n_candidates, c, *crange)
+                                     for c, crange in zip(cmap, ranges)])
+        lab = rgb_to_lab(candidates)
+        delta = lab[:, np.newaxis, :] - lab[np.newaxis, :, :]
+        distances = np.sqrt((delta ** 2).sum(axis=-1))
+        distances.flags.writeable = False
+        entry = (cmap, candidates, distances)
+        distance_cache[key] = entry
+    candidates, distances = entry[1:]
+
+    if length < 0:
+        raise ValueError("Number of colors must be non-negative.")
+    if length > len(candidates):
+        msg = "Cannot choose %d colors from %d candidates."
+        raise ValueError(msg % (length, len(candidates)))
+    if length == 0:
+        return candidates[:0]
+
+    # Start from the first candidate and greedily add the candidate with the
+    # largest distance to its nearest chosen color.
+    chosen = [0]
+    min_distance = distances[0].copy()
+    for i in range(1, length):
+        i_next = np.argmax(min_distance)
+        chosen.append(i_next)
+        np.minimum(min_distance, distances[i_next], out=min_distance)
+    return candidates[chosen]
@@ -3,4 +3,9 @@ Module for Input/Ouput
 """
 from __future__ import absolute_import
 
-from .core import save_all_figs  # noqa
+from .._lazy import lazy_attributes
+
+
+__all__ = ['save_all_figs']
+
+__getattr__ = lazy_attributes(__name__, {'save_all_figs': '.core'})
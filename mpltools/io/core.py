@@ -1,14 +1,31 @@
 from __future__ import print_function
 
 import os
-import matplotlib.pyplot as plt
+import warnings
+import multiprocessing
 
+import numpy as np
+import matplotlib as mpl
 
-def save_all_figs(directory='./', fmt='png', default_name='untitled%i'):
+
+# Formats that can be encoded from an RGBA buffer rendered by Agg, mapped to
+# the format names used by `imsave` (i.e. by PIL).
+RASTER_FORMATS = {'png': 'png', 'jpg': 'jpeg', 'jpeg': 'jpeg',
+                  'tif': 'tiff', 'tiff': 'tiff', 'webp': 'webp'}
+
+# rc parameters that configure interactive use, which aren't sent to workers.
+INTERACTIVE_RC_PARAMS = ('backend', 'backend_fallback', 'interactive',
+                         'toolbar')
+
+
+def save_all_figs(directory='./', fmt='png', default_name='untitled%i',
+                  dpi=None, processes=1):
     """Save all open figures.
 
     Each figure is saved with the title of the plot, if possible, and multiple
-    file formats can be saved by specifying a list of extensions.
+    file formats can be saved by specifying a list of extensions. Each figure
+    is drawn once for all raster formats (see `RASTER_FORMATS`), and saved
+    directly by the matching backend for other (vector) formats.
 
     Parameters
     ------------
@@ -19,18 +36,34 @@ def save_all_figs(directory='./', fmt='png', default_name='untitled%i'):
     default_name : str
         Default filename to use if plot has no title. Must contain '%i' for the
         figure number.
+    dpi : float
+        Resolution of saved figures. Defaults to rcParams['savefig.dpi'].
+    processes : int
+        Number of worker processes used to save figures. If 1, figures are
+        saved in this process; if None, use one worker per CPU. Figures are
+        pickled and sent to the workers along with the current rcParams. File
+        names are the same as when saving serially, but if several figures
+        share a title, only the last of them is saved (and reported).
 
     Examples
     --------
     >>> save_all_figs('plots/', fmt=['pdf','png'])
 
     """
+    import matplotlib.pyplot as plt
+
     if isinstance(fmt, str):
         fmt = [fmt]
 
-    for fignum in plt.get_fignums():
+    fignums = plt.get_fignums()
+    if not fignums:
+        return
+    current = plt.gcf()
+    jobs = []
+    for fignum in fignums:
+        fig = plt.figure(fignum)
         try:
-            filename = plt.figure(fignum).get_axes()[0].get_title()
+            filename = fig.get_axes()[0].get_title()
         except IndexError:
             continue
 
@@ -38,8 +71,117 @@ def save_all_figs(directory='./', fmt='png', default_name='untitled%i'):
             filename = default_name % fignum
 
         savepath = os.path.join(directory, filename)
+        jobs.append((fig, savepath, fmt, dpi))
+    # Don't change the current figure as a side effect of saving.
+    plt.figure(current.number)
 
-        for a_fmt in fmt:
-            savename = '%s.%s' % (savepath, a_fmt)
-            plt.savefig(savename)
+    if processes == 1:
+        results = (_save_figure(*job) for job in jobs)
+        _print_saved(results)
+        return
+
+    # Figures sharing a title overwrite each other; only save the last one so
+    # the result doesn't depend on which worker finishes first.
+    last = dict((job[1], i) for i, job in enumerate(jobs))
+    jobs = [job for i, job in enumerate(jobs) if last[job[1]] == i]
+
+    # Workers keep the Agg backend, whatever the backend of this process is.
+    rc = dict((key, value) for key, value in dict.items(mpl.rcParams)
+              if key not in INTERACTIVE_RC_PARAMS)
+    pool = multiprocessing.Pool(processes, initializer=_init_worker,
+                                initargs=(rc,))
+    try:
+        _print_saved(pool.imap(_save_pickled_figure, jobs))
+        pool.close()
+    except:
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
+
+
+def _print_saved(results):
+    for saved in results:
+        for savename in saved:
             print(("Saved '%s'" % savename))
+
+
+def _init_worker(rc):
+    """Set up worker process to draw figures like the parent process."""
+    import matplotlib.pyplot as plt
+    plt.switch_backend('agg')
+    with warnings.catch_warnings():
+        # Ignore warnings about deprecated parameters copied from the parent.
+        warnings.simplefilter('ignore')
+        mpl.rcParams.update(rc)
+
+
+def _save_pickled_figure(job):
+    """Save figure unpickled in a worker process and release it."""
+    import matplotlib.pyplot as plt
+    fig = job[0]
+    try:
+        return _save_figure(*job)
+    finally:
+        plt.close(fig)
+
+
+def _save_figure(fig, savepath, fmt, dpi=None):
+    """Save figure to `savepath` with an extension for each format in `fmt`.
+
+    Raster formats are encoded from a single Agg render of the figure when
+    the savefig rcParams allow it. Return list of saved file names.
+    """
+    if dpi is None:
+        dpi = mpl.rcParams['savefig.dpi']
+    if dpi == 'figure':
+        dpi = fig.dpi
+
+    raster = [f for f in fmt if f.lower() in RASTER_FORMATS]
+    if len(raster) < 2 or not _can_share_render():
+        raster = []
+
+    saved = []
+    if raster:
+        from matplotlib.image import imsave
+        rgba = _render_rgba(fig, dpi)
+        for a_fmt in raster:
+            savename = '%s.%s' % (savepath, a_fmt)
+            imsave(savename, rgba, format=RASTER_FORMATS[a_fmt.lower()],
+                   dpi=dpi)
+            saved.append(savename)
+
+    for a_fmt in fmt:
+        if a_fmt in raster:
+            continue
+        savename = '%s.%s' % (savepath, a_fmt)
+        fig.savefig(savename, format=a_fmt, dpi=dpi)
+        saved.append(savename)
+    return saved
+
+
+def _can_share_render():
+    """Return True if savefig would draw the figure exactly as displayed."""
+    rc = mpl.rcParams
+    return (rc.get('savefig.facecolor') == 'auto' and
+            rc.get('savefig.edgecolor') == 'auto' and
+            not rc.get('savefig.transparent') and
+            rc.get('savefig.bbox') != 'tight')
+
+
+def _render_rgba(fig, dpi):
+    """Return RGBA array of figure drawn by Agg at the given resolution."""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    canvas = fig.canvas
+    fig_dpi = fig.dpi
+    agg = FigureCanvasAgg(fig)
+    try:
+        fig.dpi = dpi
+        agg.draw()
+        # Copy buffer since it's owned by the renderer.
+        rgba = np.array(agg.buffer_rgba())
+    finally:
+        fig.dpi = fig_dpi
+        fig.set_canvas(canvas)
+    return rgba
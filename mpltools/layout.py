@@ -1,7 +1,7 @@
 from __future__ import division
 
 import numpy as np
-import matplotlib.pyplot as plt
+import matplotlib as mpl
 import matplotlib.ticker as mticker
 
 
@@ -28,6 +28,8 @@ def figure(aspect_ratio=0.75, scale=1, width=None, **kwargs):
     figaspect
 
     """
+    import matplotlib.pyplot as plt
+
     size = figaspect(aspect_ratio, scale=scale, width=width)
     return plt.figure(figsize=size, **kwargs)
 
@@ -61,7 +63,7 @@ def figaspect(aspect_ratio=0.75, scale=1, width=None):
         Width and height of figure.
     """
     if width is None:
-        width, h = plt.rcParams['figure.figsize']
+        width, h = mpl.rcParams['figure.figsize']
     height = width * aspect_ratio
     return width * scale, height * scale
 
@@ -78,6 +80,8 @@ def clear_frame(ax=None):
     ax : :class:`~matplotlib.axes.Axes`
         Axes to modify. If None, use current axes.
     """
+    import matplotlib.pyplot as plt
+
     ax = ax if ax is not None else plt.gca()
 
     ax.xaxis.set_ticks([])
@@ -103,7 +107,9 @@ def figimage(img, scale=1, dpi=None):
     dpi : int
         Dots per inch for figure. If None, use the default rcParam.
     """
-    dpi = dpi if dpi is not None else plt.rcParams['figure.dpi']
+    import matplotlib.pyplot as plt
+
+    dpi = dpi if dpi is not None else mpl.rcParams['figure.dpi']
 
     h, w = img.shape
     figsize = np.array((w, h), dtype=float) / dpi * scale
@@ -136,6 +142,8 @@ def cross_spines(zero_cross=False, remove_zeros=True, ax=None):
     ax : :class:`~matplotlib.axes.Axes`
         Axes to modify. If None, use current axes.
     """
+    import matplotlib.pyplot as plt
+
     ax = ax if ax is not None else plt.gca()
 
     ax.spines['right'].set_visible(False)
@@ -166,6 +174,8 @@ def pad_limits(pad_frac=0.05, ax=None):
     ax : :class:`~matplotlib.axes.Axes`
         Axes to modify. If None, use current axes.
     """
+    import matplotlib.pyplot as plt
+
     ax = ax if ax is not None else plt.gca()
     ax.set_xlim(_calc_limits(ax.xaxis, pad_frac))
     ax.set_ylim(_calc_limits(ax.yaxis, pad_frac))
@@ -185,6 +195,7 @@ def _calc_limits(axis, frac):
 
 
 if __name__ == '__main__':
+    import matplotlib.pyplot as plt
     from yutils.mpl.core import demo_plot
 
     f, ax = plt.subplots()
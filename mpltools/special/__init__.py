@@ -4,6 +4,8 @@ Module for special-purpose plots.
 """
 from __future__ import absolute_import
 
+# Imported eagerly, since the functions share names with their modules. These
+# modules only import pyplot when the functions are called.
 from .hinton import hinton
 from .errorfill import errorfill
 
@@ -1,7 +1,8 @@
 import warnings
 
 import numpy as np
-import matplotlib.pyplot as plt
+import matplotlib as mpl
+from matplotlib.patches import Rectangle
 
 
 __all__ = ['errorfill']
@@ -36,6 +37,8 @@ def errorfill(x, y, yerr=None, xerr=None, color=None, ls=None, lw=None,
     ax : Axis instance
         The plot is drawn on axis `ax`. If `None` the current axis is used
     """
+    import matplotlib.pyplot as plt
+
     ax = ax if ax is not None else plt.gca()
 
     alpha_fill *= alpha
@@ -43,9 +46,9 @@ def errorfill(x, y, yerr=None, xerr=None, color=None, ls=None, lw=None,
     if color is None:
         color = next(ax._get_lines.color_cycle)
     if ls is None:
-        ls = plt.rcParams['lines.linestyle']
+        ls = mpl.rcParams['lines.linestyle']
     if lw is None:
-        lw = plt.rcParams['lines.linewidth']
+        lw = mpl.rcParams['lines.linewidth']
     ax.plot(x, y, linestyle=ls, linewidth=lw,
             color=color, alpha=alpha, label=label, marker=marker)
 
@@ -75,18 +78,24 @@ def extrema_from_error_input(z, zerr):
 # so that filled regions show up correctly legends.
 
 def fill_between(x, y1, y2=0, ax=None, **kwargs):
+    import matplotlib.pyplot as plt
+
     ax = ax if ax is not None else plt.gca()
     ax.fill_between(x, y1, y2, **kwargs)
-    ax.add_patch(plt.Rectangle((0, 0), 0, 0, **kwargs))
+    ax.add_patch(Rectangle((0, 0), 0, 0, **kwargs))
 
 
 def fill_between_x(x, y1, y2=0, ax=None, **kwargs):
+    import matplotlib.pyplot as plt
+
     ax = ax if ax is not None else plt.gca()
     ax.fill_betweenx(x, y1, y2, **kwargs)
-    ax.add_patch(plt.Rectangle((0, 0), 0, 0, **kwargs))
+    ax.add_patch(Rectangle((0, 0), 0, 0, **kwargs))
 
 
 if __name__ == '__main__':
+    import matplotlib.pyplot as plt
+
     x = np.linspace(0, 2 * np.pi)
     y_sin = np.sin(x)
     y_cos = np.cos(x)
@@ -1,7 +1,6 @@
 from __future__ import division
 from future.builtins import zip
 import numpy as np
-import matplotlib.pyplot as plt
 from matplotlib import collections
 from matplotlib import transforms
 from matplotlib import ticker
@@ -52,6 +51,8 @@ def hinton(inarray, max_value=None, use_default_ticks=True):
         Disable tick-generation and generate them outside this function.
     """
 
+    import matplotlib.pyplot as plt
+
     ax = plt.gca()
     ax.set_axis_bgcolor('gray')
     # make sure we're working with a numpy array, not a numpy matrix
@@ -15,6 +15,14 @@ Functions
 =========
 use
     Redefine rc parameters using specified style.
+context
+    Context manager for using a style temporarily.
+Style
+    Style applied to new figures without changing global rc parameters.
+reload_library
+    Re-read changed style files.
+watch, unwatch
+    Start/stop reloading changed style files in a background thread.
 lib
     Style library.
 baselib
@@ -24,10 +32,15 @@ from __future__ import absolute_import
 
 from warnings import warn
 
-from .core import available, baselib, lib, use
+from .._lazy import lazy_attributes
 
 
-__all__ = ['available', 'baselib', 'lib', 'use']
+__all__ = ['available', 'baselib', 'context', 'lib', 'use', 'Style',
+           'reload_library', 'watch', 'unwatch']
+
+# The style library is read when one of these attributes is first used.
+__getattr__ = lazy_attributes(__name__,
+                              dict((name, '.core') for name in __all__))
 
 
 warn("""
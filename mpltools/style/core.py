@@ -1,14 +1,115 @@
 import os
-import glob
 import copy
+import glob
+import contextlib
+import atexit
+import warnings
+import threading
+try:
+    from collections.abc import Mapping, MutableMapping
+except ImportError:  # Python 2
+    from collections import Mapping, MutableMapping
+try:
+    from types import MappingProxyType
+except ImportError:  # Python 2
+    MappingProxyType = None
 
 import numpy as np
-import matplotlib.pyplot as plt
+import matplotlib as mpl
 
 from .. import _config
+from .._cache import (LRUCache, read_cache_file, write_cache_file,
+                      load_pickle, dump_pickle)
+
+
+__all__ = ['use', 'context', 'available', 'lib', 'baselib', 'Style',
+           'StyleLibrary', 'StyleDirectory', 'StyleFile', 'reload_library',
+           'watch', 'unwatch']
+
+
+BASE_STYLE_DIR = os.path.abspath(os.path.dirname(__file__))
+USER_STYLE_DIR = '~/.mplstylelib'
+USER_CONFIG_PATHS = ['~/.mplstyle', './mplstyle']
+# Style parameter naming the style(s) that a style inherits from.
+EXTENDS_KEY = 'extends'
+
+
+class StyleCache(object):
+    """Cache of parsed style files, which is saved to a single file.
+
+    Each cached entry records the size and modification time of its source
+    file, and the source file is only parsed again if either has changed.
+    New entries are written to the cache file when the interpreter exits.
+
+    Parameters
+    ----------
+    cache_path : str
+        Path of the cache file. If None, parsed files are not saved.
+    """
+
+    version = 1
+
+    def __init__(self, cache_path=None):
+        if cache_path is not None:
+            cache_path = os.path.expanduser(cache_path)
+        self.cache_path = cache_path
+        self._entries = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def read(self, path):
+        """Return nested dict of parameters parsed from style file `path`."""
+        signature = file_signature(path)
+        with self._lock:
+            entries = self._load()
+            entry = entries.get(path)
+            if entry is None or entry[0] != signature:
+                entry = (signature, _config.read(path).dict())
+                entries[path] = entry
+                self._mark_dirty()
+        # Copy, since callers may update the returned dicts.
+        return copy.deepcopy(entry[1])
+
+    def save(self):
+        """Write cache file if any entries have changed."""
+        with self._lock:
+            if not self._dirty or self.cache_path is None:
+                return
+            data = {'version': self.version, 'entries': self._entries}
+            if write_cache_file(self.cache_path,
+                                lambda f: dump_pickle(data, f)):
+                self._dirty = False
+
+    def _load(self):
+        if self._entries is None:
+            self._entries = dict()
+            if self.cache_path is not None:
+                data = read_cache_file(self.cache_path, load_pickle)
+                if data is not None and data.get('version') == self.version:
+                    self._entries = data['entries']
+        return self._entries
+
+    def _mark_dirty(self):
+        if not self._dirty and self.cache_path is not None:
+            atexit.register(self.save)
+        self._dirty = True
+
+
+def file_signature(path):
+    """Return (size, mtime) of file, or None if it doesn't exist."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_size, stat.st_mtime)
+
 
+style_cache = StyleCache(_config.config.get('style', {}).get('cache_file'))
 
-__all__ = ['use', 'available', 'lib', 'baselib']
+
+def read_style_file(path):
+    """Return dict of parameters read from style file, using `style_cache`."""
+    return style_cache.read(path)
 
 
 def use(name=None, use_baselib=False):
@@ -26,48 +127,537 @@ def use(name=None, use_baselib=False):
     """
     if np.isscalar(name):
         name = [name]
-    for s in name:
-        if use_baselib:
-            plt.rcParams.update(baselib[s])
-        else:
-            plt.rcParams.update(lib[s])
+    library = baselib if use_baselib else lib
+    update_rc_params(library.rc_params(name))
+
+
+@contextlib.contextmanager
+def context(name=None, use_baselib=False):
+    """Context manager for using a style temporarily.
+
+    Only the rc parameters set by the style are saved on entry, and they're
+    restored on exit; other parameters modified inside the context are not
+    restored.
+
+    Parameters
+    ----------
+    name : str or list of str
+        Name of style. For list of available styles see `style.available`.
+        If given a list, each style is applied from first to last in the list.
+
+    use_baselib : bool
+        If True, only use styles defined in `mpltools/style` (without user's
+        customization).
+
+    Examples
+    --------
+    >>> with style.context('ggplot'):
+    ...     plt.plot([1, 2, 3])
+    """
+    if np.isscalar(name):
+        name = [name]
+    library = baselib if use_baselib else lib
+    rc_params = library.rc_params(name)
+
+    rc = mpl.rcParams
+    get_raw = getattr(rc, '_get', lambda key: dict.__getitem__(rc, key))
+    saved = dict((key, get_raw(key)) for key in rc_params)
+    update_rc_params(rc_params)
+    try:
+        yield
+    finally:
+        update_rc_params(saved)
+
+
+def _set_facecolor(ax, color):
+    if hasattr(ax, 'set_facecolor'):
+        ax.set_facecolor(color)
+    else:  # matplotlib < 2.0
+        ax.set_axis_bgcolor(color)
+
+
+def _set_spines(ax, **kwargs):
+    for spine in ax.spines.values():
+        spine.set(**kwargs)
+
+
+def _set_color_cycle(ax, colors):
+    if hasattr(ax, 'set_prop_cycle'):
+        ax.set_prop_cycle(color=colors)
+    else:  # matplotlib < 1.5
+        ax.set_color_cycle(colors)
+
+
+def _tick_setter(axis, **keys):
+    """Return setter passing rc value as tick parameter `keys[which]`."""
+    which, param = list(keys.items())[0]
+
+    def set_ticks(ax, value):
+        ax.tick_params(axis=axis, which=which, **{param: value})
+    return set_ticks
+
+
+# Functions applying rc parameters directly to an axes (see `Style`).
+AXES_SETTERS = {
+    'axes.facecolor': _set_facecolor,
+    'axes.edgecolor': lambda ax, v: _set_spines(ax, edgecolor=v),
+    'axes.linewidth': lambda ax, v: _set_spines(ax, linewidth=v),
+    'axes.axisbelow': lambda ax, v: ax.set_axisbelow(v),
+    'axes.grid': lambda ax, v: ax.grid(v),
+    'axes.titlesize': lambda ax, v: ax.title.set_size(v),
+    'axes.labelsize': lambda ax, v: (ax.xaxis.label.set_size(v),
+                                     ax.yaxis.label.set_size(v)),
+    'axes.labelcolor': lambda ax, v: (ax.xaxis.label.set_color(v),
+                                      ax.yaxis.label.set_color(v)),
+    'axes.color_cycle': _set_color_cycle,
+    'axes.prop_cycle': lambda ax, v: ax.set_prop_cycle(v),
+    'xtick.color': _tick_setter('x', both='colors'),
+    'xtick.labelsize': _tick_setter('x', both='labelsize'),
+    'xtick.direction': _tick_setter('x', both='direction'),
+    'xtick.major.size': _tick_setter('x', major='length'),
+    'xtick.major.width': _tick_setter('x', major='width'),
+    'xtick.minor.size': _tick_setter('x', minor='length'),
+    'xtick.minor.width': _tick_setter('x', minor='width'),
+    'ytick.color': _tick_setter('y', both='colors'),
+    'ytick.labelsize': _tick_setter('y', both='labelsize'),
+    'ytick.direction': _tick_setter('y', both='direction'),
+    'ytick.major.size': _tick_setter('y', major='length'),
+    'ytick.major.width': _tick_setter('y', major='width'),
+    'ytick.minor.size': _tick_setter('y', minor='length'),
+    'ytick.minor.width': _tick_setter('y', minor='width'),
+}
+
+# Figure keyword arguments set from rc parameters (see `Style`).
+FIGURE_KWARGS = {'figure.figsize': 'figsize',
+                 'figure.dpi': 'dpi',
+                 'figure.facecolor': 'facecolor',
+                 'figure.edgecolor': 'edgecolor'}
+
+
+class Style(object):
+    """Style that is applied to new figures without changing rcParams.
+
+    Unlike `use` and `context`, a `Style` never modifies the global
+    matplotlib rc parameters, so different threads can create figures with
+    different styles at the same time. Figures are created without pyplot
+    and attached to an Agg canvas, so they can be saved with
+    `fig.savefig`.
+
+    Only figure and axes properties are styled (see `FIGURE_KWARGS` and
+    `AXES_SETTERS`), and a warning lists any other parameters of the style.
+    Artists created later (e.g. by `ax.plot`) still take their defaults from
+    the global rc parameters.
+
+    Parameters
+    ----------
+    name : str or list of str
+        Name of style. For list of available styles see `style.available`.
+        If given a list, each style is applied from first to last in the list.
+
+    use_baselib : bool
+        If True, only use styles defined in `mpltools/style` (without user's
+        customization).
+
+    Examples
+    --------
+    >>> fig, ax = style.Style('ggplot').subplots()
+    >>> ax.plot([1, 2, 3])
+    >>> fig.savefig('ggplot.png')
+    """
+
+    def __init__(self, name, use_baselib=False):
+        if np.isscalar(name):
+            name = [name]
+        library = baselib if use_baselib else lib
+        self.rc_params = library.rc_params(name)
+
+        unsupported = [key for key in self.rc_params
+                       if key not in AXES_SETTERS and
+                       key not in FIGURE_KWARGS and
+                       not key.startswith('figure.subplot.')]
+        if unsupported:
+            msg = ("Style only applies figure and axes parameters; these "
+                   "parameters are ignored: %s")
+            warnings.warn(msg % ', '.join(sorted(unsupported)), stacklevel=2)
+
+    def figure(self, **kwargs):
+        """Return new figure. Keyword arguments are passed to `Figure`."""
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        rc = self.rc_params
+        for key, kwarg in FIGURE_KWARGS.items():
+            if key in rc:
+                kwargs.setdefault(kwarg, rc[key])
+        fig = Figure(**kwargs)
+        FigureCanvasAgg(fig)
+
+        if 'subplotpars' not in kwargs:
+            # Update after creating the figure, which resets subplot params
+            # to the rc defaults when it's cleared.
+            params = ('left', 'bottom', 'right', 'top', 'wspace', 'hspace')
+            fig.subplotpars.update(**dict((p, rc.get('figure.subplot.' + p))
+                                          for p in params))
+        return fig
+
+    def subplots(self, nrows=1, ncols=1, squeeze=True, subplot_kw=None,
+                 **fig_kw):
+        """Return new figure and styled axes in a grid.
+
+        Parameters are the same as `plt.subplots`, except that sharing axes
+        is not supported.
+        """
+        fig = self.figure(**fig_kw)
+        subplot_kw = subplot_kw or {}
+        axes = np.empty((nrows, ncols), dtype=object)
+        for i in range(nrows * ncols):
+            ax = fig.add_subplot(nrows, ncols, i + 1, **subplot_kw)
+            self.style_axes(ax)
+            axes.flat[i] = ax
+        if squeeze:
+            axes = axes.squeeze()
+            if axes.ndim == 0:
+                axes = axes.item()
+        return fig, axes
+
+    def style_axes(self, ax):
+        """Apply style to an existing axes."""
+        for key, value in self.rc_params.items():
+            if key in AXES_SETTERS:
+                AXES_SETTERS[key](ax, value)
+
+
+class _ReadOnlyDict(Mapping):
+    """Read-only view of a dict, for Python versions without
+    `types.MappingProxyType`."""
+
+    def __init__(self, data):
+        self._data = data
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return repr(self._data)
+
+
+def read_only(style):
+    """Return read-only view of style dict."""
+    if MappingProxyType is not None:
+        return MappingProxyType(style)
+    return _ReadOnlyDict(style)
+
+
+def update_rc_params(rc_params):
+    """Update matplotlib rc parameters with pre-validated `rc_params`.
+
+    Unlike `plt.rcParams.update`, values are not validated again.
+    """
+    rc = mpl.rcParams
+    if hasattr(rc, '_update_raw'):
+        rc._update_raw(rc_params)
+    else:
+        dict.update(rc, rc_params)
+
+
+class StyleDirectory(object):
+    """Layer of styles defined by ``*.rc`` files in a directory.
+
+    Style names are indexed from file names, but a file is only parsed the
+    first time its style is requested.
+    """
+
+    def __init__(self, path):
+        self.path = os.path.abspath(os.path.expanduser(path))
+        self._paths = index_style_directory(self.path)
+        self._styles = dict()
+        self._signatures = dict()
+        # Incremented when styles change, so libraries sharing this layer
+        # know to resolve their styles again.
+        self.version = 0
+
+    def names(self):
+        return list(self._paths)
+
+    def __contains__(self, name):
+        return name in self._paths
+
+    def get(self, name):
+        """Return style dict for `name`."""
+        try:
+            return self._styles[name]
+        except KeyError:
+            path = self._paths[name]
+            self._signatures[name] = file_signature(path)
+            style = self._styles[name] = read_style_file(path)
+            return style
+
+    def refresh(self):
+        """Update index and forget styles whose files have changed.
+
+        Returns the set of names of added, removed, or changed styles.
+        """
+        paths = index_style_directory(self.path)
+        changed = set(paths).symmetric_difference(self._paths)
+        for name, signature in list(self._signatures.items()):
+            if name not in paths or file_signature(paths[name]) != signature:
+                changed.add(name)
+                del self._signatures[name]
+                self._styles.pop(name, None)
+        self._paths = paths
+        if changed:
+            self.version += 1
+        return changed
+
+
+class StyleFile(object):
+    """Layer of styles defined as sections of an ``mplstyle`` file."""
+
+    def __init__(self, path):
+        self.path = os.path.abspath(os.path.expanduser(path))
+        self.version = 0
+        self._read()
+
+    def _read(self):
+        self._signature = file_signature(self.path)
+        self._styles = dict()
+        if self._signature is not None:
+            self._styles = read_style_dict(read_style_file(self.path))
+
+    def names(self):
+        return list(self._styles)
+
+    def __contains__(self, name):
+        return name in self._styles
+
+    def get(self, name):
+        """Return style dict for `name`."""
+        return self._styles[name]
+
+    def refresh(self):
+        """Read file again if it has changed.
+
+        Returns the set of names of styles defined before or after the change.
+        """
+        if file_signature(self.path) == self._signature:
+            return set()
+        changed = set(self._styles)
+        self._read()
+        self.version += 1
+        return changed | set(self._styles)
+
+
+class StyleLibrary(MutableMapping):
+    """Dict-like library of styles resolved from layers of style sources.
+
+    A style is resolved the first time it's requested by merging its
+    definitions in each layer, from lowest to highest priority. Styles
+    defined in a single layer are shared with that layer instead of copied,
+    so libraries that share layers (e.g. `baselib` and `lib`) share their
+    unmodified styles. Styles are therefore returned as read-only mappings;
+    to change a style, assign a new dict to the library, e.g.
+    ``lib['mine'] = dict(lib['mine'], **{'lines.linewidth': 5})``.
+    Assigning or deleting styles only affects this library, not its layers.
+
+    A style can inherit parameters from other styles by naming them in an
+    ``extends`` parameter (a style name or list of names). Inherited styles
+    are applied in order, then overridden by the style's own parameters.
+    Each resolved style is cached.
+
+    Resolving styles and refreshing layers are serialized by a lock shared by
+    all libraries (since they may share layers), so that `watch` can refresh
+    layers while other threads use styles.
+
+    Parameters
+    ----------
+    layers : list of `StyleDirectory` or `StyleFile`
+        Style sources, from lowest to highest priority.
+    """
+
+    # Shared by all libraries; reentrant, since `rc_params` uses `__getitem__`.
+    _lock = threading.RLock()
+
+    def __init__(self, layers=()):
+        self.layers = list(layers)
+        self._assigned = dict()
+        self._deleted = set()
+        self._resolved = dict()
+        self._rc_cache = LRUCache(maxsize=128)
+        self._layer_versions = self._current_layer_versions()
+
+    def _current_layer_versions(self):
+        return tuple(layer.version for layer in self.layers)
+
+    def _check_layers(self):
+        """Clear resolved styles if a layer changed, e.g. when it was
+        refreshed through another library sharing it."""
+        versions = self._current_layer_versions()
+        if versions != self._layer_versions:
+            self._layer_versions = versions
+            self._clear_resolved()
+
+    def __getitem__(self, name):
+        with self._lock:
+            self._check_layers()
+            try:
+                return self._resolved[name]
+            except KeyError:
+                return self._resolve(name, [])
+
+    def __setitem__(self, name, style):
+        with self._lock:
+            # Copy, so that later changes to `style` can't make the memoized
+            # `rc_params` stale.
+            self._assigned[name] = dict(style)
+            self._deleted.discard(name)
+            self._clear_resolved()
+
+    def __delitem__(self, name):
+        with self._lock:
+            if name not in self:
+                raise KeyError(name)
+            self._assigned.pop(name, None)
+            self._deleted.add(name)
+            self._clear_resolved()
+
+    def _definition(self, name):
+        """Return style dict for `name` before resolving inheritance."""
+        if name in self._assigned:
+            return self._assigned[name]
+        if name in self._deleted:
+            raise KeyError(name)
+
+        found = [layer.get(name) for layer in self.layers if name in layer]
+        if not found:
+            raise KeyError(name)
+        if len(found) == 1:
+            return found[0]
+        style = dict()
+        for layer_style in found:
+            style.update(layer_style)
+        return style
+
+    def _resolve(self, name, chain):
+        """Return style with parameters inherited from the styles it extends.
+
+        `chain` is the list of styles extending this style, which is used to
+        detect circular inheritance.
+        """
+        if name in self._resolved:
+            return self._resolved[name]
+        if name in chain:
+            cycle = ' -> '.join(chain[chain.index(name):] + [name])
+            raise ValueError("Circular style inheritance: %s" % cycle)
+
+        style = self._definition(name)
+        if EXTENDS_KEY in style:
+            bases = style[EXTENDS_KEY]
+            if isinstance(bases, str):
+                bases = [bases]
+            resolved = dict()
+            for base in bases:
+                if base not in self:
+                    msg = "Style %r extends unknown style %r."
+                    raise KeyError(msg % (name, base))
+                resolved.update(self._resolve(base, chain + [name]))
+            resolved.update(style)
+            del resolved[EXTENDS_KEY]
+            style = resolved
+
+        style = self._resolved[name] = read_only(style)
+        return style
+
+    def refresh(self):
+        """Re-read changed style files of all layers.
+
+        Returns the set of names of added, removed, or changed styles.
+        """
+        with self._lock:
+            changed = set()
+            for layer in self.layers:
+                changed.update(layer.refresh())
+            # Libraries sharing a changed layer clear their resolved styles
+            # when they're next used (see `_check_layers`).
+            self._check_layers()
+        return changed
+
+    def _clear_resolved(self):
+        # Styles extending a modified style also need to be resolved again.
+        self._resolved.clear()
+        self._rc_cache.clear()
+
+    def __iter__(self):
+        return iter(sorted(self._names()))
+
+    def __len__(self):
+        return len(self._names())
+
+    def __contains__(self, name):
+        if name in self._assigned:
+            return True
+        if name in self._deleted:
+            return False
+        return any(name in layer for layer in self.layers)
+
+    def _names(self):
+        names = set(self._assigned)
+        for layer in self.layers:
+            names.update(layer.names())
+        return (names - self._deleted) | set(self._assigned)
+
+    def rc_params(self, names):
+        """Return validated rc parameters merged from a list of styles.
+
+        Styles are merged from first to last in `names`, and values are
+        validated by matplotlib. The result is memoized for each combination
+        of names. Since styles are read-only, the memo is only invalidated
+        by assigning or deleting styles and by `refresh`.
+        """
+        with self._lock:
+            self._check_layers()
+            key = tuple(names)
+            rc_params = self._rc_cache.get(key)
+            if rc_params is None:
+                validated = mpl.RcParams()
+                for name in names:
+                    validated.update(self[name])
+                rc_params = dict(dict.items(validated))
+                self._rc_cache[key] = rc_params
+        return rc_params
 
 
 def load_base_library():
     """Load style library from package"""
-    library = dict()
-    style_dir = os.path.abspath(os.path.dirname(__file__))
-    library.update(read_style_directory(style_dir))
-    return library
+    return StyleLibrary([StyleDirectory(BASE_STYLE_DIR)])
 
 
 def update_user_library(base_library):
     """Update style library with user-defined rc files"""
+    layers = [StyleDirectory(USER_STYLE_DIR)]
+    layers.extend(StyleFile(path) for path in USER_CONFIG_PATHS)
+    return StyleLibrary(base_library.layers + layers)
 
-    library = copy.deepcopy(base_library)
 
-    stylelib_path = os.path.expanduser('~/.mplstylelib')
-    if os.path.exists(stylelib_path) and os.path.isdir(stylelib_path):
-        styles = read_style_directory(stylelib_path)
-        update_nested_dict(library, styles)
-
-    for cfg in _config.iter_paths(['~/.mplstyle', './mplstyle']):
-        styles = read_style_dict(cfg)
-        update_nested_dict(library, styles)
-    return library
+def index_style_directory(style_dir):
+    """Return dict mapping style names to paths of rc files in `style_dir`."""
+    index = dict()
+    for style_path in glob.glob(os.path.join(style_dir, '*.rc')):
+        filename = os.path.basename(style_path)
+        # remove last three letters, which are '.rc'
+        index[filename[:-3]] = style_path
+    return index
 
 
 def read_style_directory(style_dir):
     styles = dict()
-    library_glob = os.path.join(style_dir, '*.rc')
-    style_files = glob.glob(library_glob)
-
-    for style_path in style_files:
-        filename = os.path.basename(style_path)
-        cfg = _config.read(style_path)
-        # remove last three letters, which are '.rc'
-        styles[filename[:-3]] = cfg.dict()
-
+    for name, style_path in index_style_directory(style_dir).items():
+        styles[name] = read_style_file(style_path)
     return styles
 
 
@@ -102,6 +692,75 @@ def update_nested_dict(main_dict, new_dict):
     return main_dict
 
 
+def reload_library():
+    """Re-read changed style files into `lib`, `baselib`, and `available`.
+
+    Only style files that were added, removed, or modified (according to
+    their size and modification time) are read again.
+    """
+    # `lib` includes the layers of `baselib`, so each layer is refreshed once
+    # and `baselib` picks up changes to the layers they share.
+    changed = lib.refresh()
+    # Update in place, since `available` is imported by other modules.
+    available[:] = list(lib.keys())
+    return changed
+
+
+class StyleWatcher(threading.Thread):
+    """Daemon thread that polls style files and reloads changed styles.
+
+    Parameters
+    ----------
+    interval : float
+        Time in seconds between checks for changed style files.
+    """
+
+    def __init__(self, interval=2.0):
+        threading.Thread.__init__(self, name='mpltools-style-watcher')
+        self.daemon = True
+        self.interval = interval
+        self._stopped = threading.Event()
+
+    def run(self):
+        while True:
+            # Check `is_set`, since `wait` returns None on Python 2.6.
+            self._stopped.wait(self.interval)
+            if self._stopped.is_set():
+                break
+            try:
+                reload_library()
+            except Exception as error:
+                # Keep watching, e.g. while a style file is being edited.
+                warnings.warn("Failed to reload styles: %s" % error)
+
+    def stop(self):
+        self._stopped.set()
+
+
+_watcher = None
+
+
+def watch(interval=2.0):
+    """Start reloading changed style files in a background thread.
+
+    Style files in ``~/.mplstylelib``, ``~/.mplstyle``, ``./mplstyle``, and
+    the package's style directory are checked every `interval` seconds.
+    """
+    global _watcher
+    unwatch()
+    _watcher = StyleWatcher(interval)
+    _watcher.start()
+    return _watcher
+
+
+def unwatch():
+    """Stop reloading style files started by `watch`."""
+    global _watcher
+    if _watcher is not None:
+        _watcher.stop()
+        _watcher = None
+
+
 # Load style libraries
 # ====================
 baselib = load_base_library()
@@ -6,8 +6,11 @@ if not hasattr(mwidgets, 'AxesWidget'):
     raise ImportError(msg)
 
 
-from .rectangle_selector import RectangleSelector
-from .slider import Slider
+from .._lazy import lazy_attributes
 
 
 __all__ = ['RectangleSelector', 'Slider']
+
+__getattr__ = lazy_attributes(__name__,
+                              {'RectangleSelector': '.rectangle_selector',
+                               'Slider': '.slider'})